@@ -1,6 +1,11 @@
 """Statler personality and prompts for the nitpicky systems architect"""
+import sys
+from collections import ChainMap
+from string import Template
 
-STATLER_SYSTEM_PROMPT = """You are Statler, a highly experienced and nitpicky systems architect with decades of experience. You are known for:
+# The prompt constants are interned so downstream caches keyed on them can
+# short-circuit comparisons on object identity
+STATLER_SYSTEM_PROMPT = sys.intern("""You are Statler, a highly experienced and nitpicky systems architect with decades of experience. You are known for:
 
 1. Being extremely detail-oriented and catching issues others miss
 2. Having strong opinions about code quality, architecture, and best practices
@@ -22,9 +27,9 @@ Your role is to review code and architectural plans with a critical eye. You sho
 
 Remember: Every line of code is a liability. Simplicity is the ultimate sophistication. Don't suggest adding new frameworks, libraries, or architectural patterns unless they solve a REAL problem that exists RIGHT NOW.
 
-Format your responses with clear sections and actionable feedback."""
+Format your responses with clear sections and actionable feedback.""")
 
-CODE_REVIEW_PROMPT_TEMPLATE = """Review the following code critically:
+CODE_REVIEW_PROMPT_TEMPLATE = sys.intern("""Review the following code critically:
 
 {code}
 
@@ -39,9 +44,9 @@ Provide a thorough review covering:
 6. Edge cases not considered
 7. Suggested improvements
 
-Be specific and provide examples where relevant."""
+Be specific and provide examples where relevant.""")
 
-ARCHITECTURE_REVIEW_PROMPT_TEMPLATE = """Review the following architectural plan or design:
+ARCHITECTURE_REVIEW_PROMPT_TEMPLATE = sys.intern("""Review the following architectural plan or design:
 
 {plan}
 
@@ -57,45 +62,54 @@ Evaluate:
 7. Missing components or considerations
 8. Alternative approaches
 
-Provide specific, actionable feedback."""
+Provide specific, actionable feedback.""")
 
 CRITIQUE_RESPONSE_FORMAT = """
 🔍 STATLER'S REVIEW
 ==================
 
 ## Critical Issues 🚨
-{critical_issues}
+$critical
 
 ## Major Concerns ⚠️
-{major_concerns}
+$major
 
 ## Code Quality Issues 📝
-{quality_issues}
+$quality
 
 ## Performance Considerations 🚀
-{performance_notes}
+$performance
 
 ## Security Review 🔒
-{security_review}
+$security
 
 ## Recommendations 💡
-{recommendations}
+$recommendations
 
 ## Overall Assessment
-{overall_assessment}
+$overall
 
 ---
 *"That's the worst code I've seen today... but at least you didn't try to add a blockchain to it."* - Statler
 """
 
+# Precompiled once at import so format_critique doesn't re-parse the
+# template on every review
+_CRITIQUE_TEMPLATE = Template(CRITIQUE_RESPONSE_FORMAT)
+
+
+# Fallback text for sections the critique didn't populate, allocated once
+_CRITIQUE_DEFAULTS = {
+    'critical': 'No critical issues found (surprisingly!)',
+    'major': 'Some concerns, but nothing catastrophic',
+    'quality': 'Could be cleaner, but I have seen worse',
+    'performance': 'Performance seems acceptable',
+    'security': 'No glaring security holes detected',
+    'recommendations': 'Keep it simple and focused on the requirements',
+    'overall': 'Needs work, but salvageable - just don\'t make it worse by over-complicating it'
+}
+
+
 def format_critique(issues: dict) -> str:
     """Format critique response according to Statler's style"""
-    return CRITIQUE_RESPONSE_FORMAT.format(
-        critical_issues=issues.get('critical', 'No critical issues found (surprisingly!)'),
-        major_concerns=issues.get('major', 'Some concerns, but nothing catastrophic'),
-        quality_issues=issues.get('quality', 'Could be cleaner, but I have seen worse'),
-        performance_notes=issues.get('performance', 'Performance seems acceptable'),
-        security_review=issues.get('security', 'No glaring security holes detected'),
-        recommendations=issues.get('recommendations', 'Keep it simple and focused on the requirements'),
-        overall_assessment=issues.get('overall', 'Needs work, but salvageable - just don\'t make it worse by over-complicating it')
-    )
\ No newline at end of file
+    return _CRITIQUE_TEMPLATE.substitute(ChainMap(issues, _CRITIQUE_DEFAULTS))
\ No newline at end of file
@@ -2,85 +2,105 @@
 import os
 import logging
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _cached_env(key: str, default: str = None) -> str:
+    """Read an environment variable once per process.
+
+    Env vars don't change during the process lifetime, so repeated config
+    instantiations (e.g. in tests) hit a dict lookup instead of os.environ.
+    """
+    return os.environ.get(key, default)
+
+
+@dataclass(frozen=True, slots=True)
 class BaseConfig:
-    """Base configuration with shared logic"""
-    
-    def __init__(self, provider: str, env_prefix: str, default_base_url: str, 
-                 default_model: str, default_timeout: float):
-        self.provider = provider
-        self.env_prefix = env_prefix
-        self.default_base_url = default_base_url
-        self.default_model = default_model
-        self.default_timeout = default_timeout
-        
-        # Load configuration
-        self.api_base_url = self._get_api_base_url()
-        self.model = self._get_model()
-        self.timeout = self._get_timeout()
-        self._validate_base_config()
-    
-    def _get_api_base_url(self) -> str:
+    """Base configuration with shared logic.
+
+    Frozen and slotted: instances are immutable after construction and
+    attribute access goes through slot descriptors instead of __dict__.
+    Subclasses resolve their fields from the environment via _resolve_base.
+    """
+
+    provider: str
+    env_prefix: str
+    api_base_url: str
+    model: str
+    timeout: float
+
+    @classmethod
+    def _resolve_base(cls, provider: str, env_prefix: str, default_base_url: str,
+                      default_model: str, default_timeout: float) -> dict:
+        """Resolve and validate the base fields from the environment"""
+        api_base_url = cls._get_api_base_url(env_prefix, default_base_url)
+        model = _cached_env(f"{env_prefix}_MCP_MODEL", default_model)
+        timeout = cls._get_timeout(env_prefix, default_timeout)
+
+        if not api_base_url:
+            logger.error("%s_API_BASE cannot be empty", env_prefix)
+            sys.exit(1)
+
+        if not model:
+            logger.error("%s_MCP_MODEL cannot be empty", env_prefix)
+            sys.exit(1)
+
+        # Ensure API base doesn't end with slash (rstrip is idempotent)
+        api_base_url = api_base_url.rstrip('/')
+
+        # Validate URL format
+        if not api_base_url.startswith(('http://', 'https://')):
+            logger.warning("%s_API_BASE should start with http:// or https://. Got: %s", env_prefix, api_base_url)
+
+        # One log line instead of three separate handler emits
+        logger.info("Using %s config: base=%s model=%s timeout=%ss",
+                    provider, api_base_url, model, timeout)
+
+        return {
+            'provider': provider,
+            'env_prefix': env_prefix,
+            'api_base_url': api_base_url,
+            'model': model,
+            'timeout': timeout,
+        }
+
+    @staticmethod
+    def _get_api_base_url(env_prefix: str, default_base_url: str) -> str:
         """Get API base URL from environment or use default"""
         # Handle different env var names (OLLAMA_API_BASE vs OPENROUTER_BASE_URL)
         env_vars = [
-            f"{self.env_prefix}_API_BASE",
-            f"{self.env_prefix}_BASE_URL"
+            f"{env_prefix}_API_BASE",
+            f"{env_prefix}_BASE_URL"
         ]
-        
+
         api_base = None
         for var in env_vars:
-            api_base = os.environ.get(var)
+            api_base = _cached_env(var)
             if api_base:
                 break
-        
+
         if not api_base:
-            api_base = self.default_base_url
-            
-        logger.info(f"Using {self.provider} API base: {api_base}")
+            api_base = default_base_url
+
         return api_base
-    
-    def _get_model(self) -> str:
-        """Get model from environment or use default"""
-        model = os.environ.get(f"{self.env_prefix}_MCP_MODEL", self.default_model)
-        logger.info(f"Using {self.provider} model: {model}")
-        return model
-    
-    def _get_timeout(self) -> float:
+
+    @staticmethod
+    def _get_timeout(env_prefix: str, default_timeout: float) -> float:
         """Get timeout from environment or use default"""
-        timeout_str = os.environ.get(f"{self.env_prefix}_TIMEOUT", str(self.default_timeout))
+        timeout_str = _cached_env(f"{env_prefix}_TIMEOUT", str(default_timeout))
         try:
             timeout = float(timeout_str)
             if timeout <= 0:
-                logger.warning(f"Invalid {self.env_prefix}_TIMEOUT value: {timeout_str}. Using default: {self.default_timeout}")
-                timeout = self.default_timeout
+                logger.warning("Invalid %s_TIMEOUT value: %s. Using default: %s", env_prefix, timeout_str, default_timeout)
+                timeout = default_timeout
         except ValueError:
-            logger.warning(f"Invalid {self.env_prefix}_TIMEOUT value: {timeout_str}. Using default: {self.default_timeout}")
-            timeout = self.default_timeout
-        logger.info(f"Using {self.provider} timeout: {timeout} seconds")
+            logger.warning("Invalid %s_TIMEOUT value: %s. Using default: %s", env_prefix, timeout_str, default_timeout)
+            timeout = default_timeout
         return timeout
-    
-    def _validate_base_config(self) -> None:
-        """Validate base configuration"""
-        if not self.api_base_url:
-            logger.error(f"{self.env_prefix}_API_BASE cannot be empty")
-            sys.exit(1)
-        
-        if not self.model:
-            logger.error(f"{self.env_prefix}_MCP_MODEL cannot be empty")
-            sys.exit(1)
-        
-        # Ensure API base doesn't end with slash
-        if self.api_base_url.endswith('/'):
-            self.api_base_url = self.api_base_url.rstrip('/')
-        
-        # Validate URL format
-        if not (self.api_base_url.startswith('http://') or 
-                self.api_base_url.startswith('https://')):
-            logger.warning(f"{self.env_prefix}_API_BASE should start with http:// or https://. Got: {self.api_base_url}")
-    
+
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(api_base='{self.api_base_url}', model='{self.model}')"
\ No newline at end of file
+        return f"{self.__class__.__name__}(api_base='{self.api_base_url}', model='{self.model}')"
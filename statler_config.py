@@ -1,38 +1,76 @@
 """Configuration for Statler MCP Server"""
 import logging
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from shared_config import BaseConfig
 
+logger = logging.getLogger(__name__)
 
+
+# repr=False keeps BaseConfig's compact __repr__
+@dataclass(frozen=True, slots=True, repr=False)
 class Config(BaseConfig):
     """Configuration handler for Statler MCP"""
-    
-    def __init__(self):
-        super().__init__(
+
+    # Endpoint URLs precomputed once at construction; the base URL never
+    # changes afterwards, so per-request f-string rebuilds are wasted work
+    generate_url: str
+    chat_url: str
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build the config from environment variables"""
+        fields = cls._resolve_base(
             provider="Ollama",
             env_prefix="OLLAMA",
             default_base_url="http://localhost:11434",
             default_model="llama3.2",
             default_timeout=300.0
         )
-        
-        # Keep compatibility with existing code
-        self.ollama_api_base = self.api_base_url
-        self.ollama_model = self.model
-        self.ollama_timeout = self.timeout
-    
+        api_base = fields['api_base_url']
+        return cls(**fields,
+                   generate_url=f"{api_base}/api/generate",
+                   chat_url=f"{api_base}/api/chat")
+
+    # Keep compatibility with existing code
+    @property
+    def ollama_api_base(self) -> str:
+        return self.api_base_url
+
+    @property
+    def ollama_model(self) -> str:
+        return self.model
+
+    @property
+    def ollama_timeout(self) -> float:
+        return self.timeout
+
     def get_ollama_generate_url(self) -> str:
         """Get the full URL for Ollama generate endpoint"""
-        return f"{self.ollama_api_base}/api/generate"
-    
+        return self.generate_url
+
     def get_ollama_chat_url(self) -> str:
         """Get the full URL for Ollama chat endpoint"""
-        return f"{self.ollama_api_base}/api/chat"
+        return self.chat_url
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide Config singleton, constructing it on first use"""
+    return Config.from_env()
+
 
+def __getattr__(name: str):
+    """Lazily construct the global config on first access (PEP 562).
 
-# Global config instance
-try:
-    config = Config()
-except Exception as e:
-    logger.error(f"Failed to initialize configuration: {e}")
-    sys.exit(1)
+    Keeps `from statler_config import config` working without paying
+    env resolution and validation at import time.
+    """
+    if name == "config":
+        try:
+            return get_config()
+        except Exception as e:
+            logger.error(f"Failed to initialize configuration: {e}")
+            sys.exit(1)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
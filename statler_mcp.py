@@ -2,16 +2,14 @@
 """Statler MCP Server - A nitpicky systems architect for code review"""
 import asyncio
 import logging
+import re
 import sys
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from mcp.server.fastmcp import FastMCP
 
-# Add parent directory to path for imports
-sys.path.insert(0, '.')
-
-from tools.statler_architect import create_architect, StatlerArchitect
-from statler_config import config
+if TYPE_CHECKING:
+    from tools.statler_architect import StatlerArchitect
 
 # Configure logging
 logging.basicConfig(
@@ -24,7 +22,10 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("Statler MCP")
 
 # Global architect instance
-architect: Optional[StatlerArchitect] = None
+architect: Optional["StatlerArchitect"] = None
+
+# Single-pass heuristic for the code-vs-plan log line
+_CODE_RE = re.compile(r'\b(?:def|class)\s')
 
 
 @mcp.tool()
@@ -44,12 +45,16 @@ async def statler_architect(code_or_plan: str, context: str = "") -> str:
         Detailed critique with specific issues and recommendations
     """
     global architect
-    
+
     try:
         if not architect:
+            # Imported here so the server starts without paying for the
+            # architect's httpx/config dependencies up front
+            from tools.statler_architect import create_architect
+
             architect = await create_architect()
         
-        logger.info(f"Statler reviewing {'code' if 'def ' in code_or_plan or 'class ' in code_or_plan else 'plan'}")
+        logger.info(f"Statler reviewing {'code' if _CODE_RE.search(code_or_plan) else 'plan'}")
         
         # Perform the review
         critique = await architect.review(code_or_plan, context)
@@ -57,6 +62,8 @@ async def statler_architect(code_or_plan: str, context: str = "") -> str:
         return critique
         
     except Exception as e:
+        from statler_config import config
+
         logger.error(f"Error in statler_architect: {e}")
         error_msg = f"Statler encountered an error: {str(e)}\n\n"
         error_msg += "Make sure:\n"
@@ -94,23 +101,31 @@ Statler will review it for:
 He's nitpicky but constructive!"""
 
 
+# Rendered once on first fetch; the config never changes after startup
+_config_text: Optional[str] = None
+
+
 @mcp.resource("statler://config")
 def get_config() -> str:
     """Get current Statler configuration"""
-    return f"""Current Statler Configuration:
-    
+    global _config_text
+
+    if _config_text is None:
+        from statler_config import config
+
+        _config_text = f"""Current Statler Configuration:
+
 Ollama API Base: {config.ollama_api_base}
 Ollama Model: {config.ollama_model}
 
 To change these, set environment variables:
 - OLLAMA_API_BASE (default: http://localhost:11434)
 - OLLAMA_MCP_MODEL (default: llama3.2)"""
+    return _config_text
 
 
-@mcp.resource("statler://personality")
-def get_personality() -> str:
-    """Get Statler's personality description"""
-    return """Meet Statler, Your Nitpicky Systems Architect:
+# Fully static, so built once at import
+_PERSONALITY_TEXT = """Meet Statler, Your Nitpicky Systems Architect:
 
 Statler is a highly experienced systems architect with decades of experience.
 He's known for:
@@ -127,6 +142,12 @@ He wants your code to be the best it can be!
 "That's the worst code I've seen today... but I've seen worse." - Statler"""
 
 
+@mcp.resource("statler://personality")
+def get_personality() -> str:
+    """Get Statler's personality description"""
+    return _PERSONALITY_TEXT
+
+
 async def cleanup():
     """Cleanup resources on shutdown"""
     global architect
@@ -137,6 +158,8 @@ async def cleanup():
 
 def main():
     """Main entry point"""
+    from statler_config import config
+
     logger.info(f"Starting Statler MCP Server...")
     logger.info(f"Configuration: {config}")
     
@@ -2,15 +2,35 @@
 """Unit test for Statler MCP with a malformed hello world app"""
 import unittest
 import asyncio
+import re
 import sys
 sys.path.insert(0, '.')
 
 from tools.statler_architect import create_architect
 
 
-class TestStatlerMalformedCode(unittest.TestCase):
+def _found(lower_result: str, words: set, *keywords: str) -> bool:
+    """Check whether any keyword appears in the review.
+
+    Single words are looked up in the pre-tokenized word set (O(1) per
+    keyword); phrases and stem matches (e.g. "credential" inside
+    "credentials") fall back to a substring search.
+    """
+    if any(' ' not in kw and kw in words for kw in keywords):
+        return True
+    return any(kw in lower_result for kw in keywords)
+
+
+class TestStatlerMalformedCode(unittest.IsolatedAsyncioTestCase):
     """Test Statler's ability to critique malformed code"""
-    
+
+    async def asyncSetUp(self):
+        """Create the architect on the test runner's event loop"""
+        self.architect = await create_architect()
+
+    async def asyncTearDown(self):
+        await self.architect.client.aclose()
+
     def setUp(self):
         """Set up test fixtures"""
         # Intentionally malformed hello world with multiple issues
@@ -57,77 +77,61 @@ DB_PASSWORD = "admin123"
         
         self.hello_world_context = "A simple hello world application with colored output"
     
-    def test_statler_review(self):
+    async def test_statler_review(self):
         """Test that Statler identifies multiple issues in malformed code"""
-        async def run_test():
-            architect = await create_architect()
-            
-            try:
-                result = await architect.review(
-                    code_or_plan=self.malformed_hello_world,
-                    context=self.hello_world_context
-                )
-                
-                # Verify Statler found critical issues
-                self.assertIn("Critical Issues", result, "Should identify critical issues")
-                
-                # Check for specific issue detection
-                lower_result = result.lower()
-                
-                # Security issues
-                self.assertTrue(
-                    "sql injection" in lower_result or 
-                    "injection" in lower_result or
-                    "security" in lower_result,
-                    "Should identify SQL injection vulnerability"
-                )
-                
-                # Dangerous practices
-                self.assertTrue(
-                    "eval" in lower_result or 
-                    "dangerous" in lower_result,
-                    "Should identify dangerous eval usage"
-                )
-                
-                # Code quality issues
-                self.assertTrue(
-                    "except" in lower_result or 
-                    "error handling" in lower_result or
-                    "bare except" in lower_result,
-                    "Should identify poor error handling"
-                )
-                
-                # Hardcoded credentials
-                self.assertTrue(
-                    "credential" in lower_result or 
-                    "password" in lower_result or
-                    "api_key" in lower_result or
-                    "hardcoded" in lower_result,
-                    "Should identify hardcoded credentials"
-                )
-                
-                # Check that recommendations are provided
-                self.assertIn("Recommendations", result, "Should provide recommendations")
-                
-                print("\n" + "="*60)
-                print("STATLER'S REVIEW OF MALFORMED HELLO WORLD:")
-                print("="*60)
-                print(result)
-                print("="*60)
-                
-                return result
-                
-            finally:
-                await architect.client.aclose()
-        
-        # Run the async test
-        result = asyncio.run(run_test())
-        
+        result = await self.architect.review(
+            code_or_plan=self.malformed_hello_world,
+            context=self.hello_world_context,
+            kind="code"
+        )
+
+        # Verify Statler found critical issues
+        self.assertIn("Critical Issues", result, "Should identify critical issues")
+
+        # Check for specific issue detection; tokenize once so
+        # single-word keywords become set lookups instead of
+        # repeated full-text scans
+        lower_result = result.lower()
+        words = set(re.findall(r"[a-z_]+", lower_result))
+
+        # Security issues
+        self.assertTrue(
+            _found(lower_result, words, "sql injection", "injection", "security"),
+            "Should identify SQL injection vulnerability"
+        )
+
+        # Dangerous practices
+        self.assertTrue(
+            _found(lower_result, words, "eval", "dangerous"),
+            "Should identify dangerous eval usage"
+        )
+
+        # Code quality issues
+        self.assertTrue(
+            _found(lower_result, words, "except", "error handling", "bare except"),
+            "Should identify poor error handling"
+        )
+
+        # Hardcoded credentials
+        self.assertTrue(
+            _found(lower_result, words, "credential", "password", "api_key", "hardcoded"),
+            "Should identify hardcoded credentials"
+        )
+
+        # Check that recommendations are provided
+        self.assertIn("Recommendations", result, "Should provide recommendations")
+
+        print("\n" + "="*60)
+        print("STATLER'S REVIEW OF MALFORMED HELLO WORLD:")
+        print("="*60)
+        print(result)
+        print("="*60)
+
         # Additional assertions
         self.assertIsNotNone(result)
         self.assertGreater(len(result), 100, "Review should be substantial")
     
-    def test_minimal_good_code(self):
+    async def test_minimal_good_code(self):
         """Test Statler with properly written code for comparison"""
         good_hello_world = '''
 #!/usr/bin/env python3
@@ -163,51 +167,46 @@ if __name__ == "__main__":
         print(f"Error: {e}")
 '''
         
-        async def run_test():
-            architect = await create_architect()
-            
-            try:
-                result = await architect.review(
-                    code_or_plan=good_hello_world,
-                    context="A properly written hello world with termcolor"
-                )
-                
-                print("\n" + "="*60)
-                print("STATLER'S REVIEW OF GOOD HELLO WORLD:")
-                print("="*60)
-                print(result)
-                print("="*60)
-                
-                # Good code should have fewer critical issues
-                lower_result = result.lower()
-                
-                # Should not have major security issues
-                self.assertNotIn("sql injection", lower_result)
-                self.assertNotIn("eval", lower_result)
-                self.assertNotIn("hardcoded", lower_result)
-                
-                return result
-                
-            finally:
-                await architect.client.aclose()
-        
-        asyncio.run(run_test())
+        result = await self.architect.review(
+            code_or_plan=good_hello_world,
+            context="A properly written hello world with termcolor",
+            kind="code"
+        )
+
+        print("\n" + "="*60)
+        print("STATLER'S REVIEW OF GOOD HELLO WORLD:")
+        print("="*60)
+        print(result)
+        print("="*60)
+
+        # Good code should have fewer critical issues
+        lower_result = result.lower()
+
+        # Should not have major security issues
+        self.assertNotIn("sql injection", lower_result)
+        self.assertNotIn("eval", lower_result)
+        self.assertNotIn("hardcoded", lower_result)
 
 
 if __name__ == "__main__":
     # Check if Ollama is available before running tests
-    import httpx
     import os
-    
+
+    from tools.http_clients import get_client
+
     api_base = os.getenv('OLLAMA_API_BASE', 'http://localhost:11434')
     model = os.getenv('OLLAMA_MCP_MODEL', 'llama3.2')
-    
+
     print(f"Testing with Ollama at: {api_base}")
     print(f"Using model: {model}")
-    
+
+    async def _probe_ollama() -> int:
+        """Preflight /api/tags on the shared pooled client"""
+        response = await get_client(5.0).get(f"{api_base}/api/tags")
+        return response.status_code
+
     try:
-        response = httpx.get(f"{api_base}/api/tags", timeout=5)
-        if response.status_code != 200:
+        if asyncio.run(_probe_ollama()) != 200:
             print(f"⚠️  Warning: Ollama doesn't appear to be running properly at {api_base}")
             print("   Start Ollama with: ollama serve")
             sys.exit(1)
@@ -216,6 +215,6 @@ if __name__ == "__main__":
         print(f"   Error: {e}")
         print("   Please ensure Ollama is running")
         sys.exit(1)
-    
+
     # Run the tests
     unittest.main(verbosity=2)
\ No newline at end of file
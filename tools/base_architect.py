@@ -1,9 +1,16 @@
 """Base architect class with shared functionality for Statler and Waldorf"""
+import asyncio
+import hashlib
 import logging
+import os
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from httpx import AsyncClient, HTTPStatusError, ConnectError, ReadTimeout
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from httpx import HTTPStatusError, ConnectError, ReadTimeout
 
+from tools.http_clients import get_client
 from prompts.statler_prompts import (
     STATLER_SYSTEM_PROMPT,
     CODE_REVIEW_PROMPT_TEMPLATE,
@@ -13,42 +20,110 @@ from prompts.statler_prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Both models follow the prompt template's markdown headers almost all of
+# the time; splitting on them is far cheaper (and more accurate) than the
+# per-line keyword scan, which stays as the fallback
+HEADER_RE = re.compile(
+    r"^#+\s*(critical|major|code quality|quality|performance|security|"
+    r"recommendations?|overall)[^\n]*$",
+    re.MULTILINE | re.IGNORECASE
+)
+
+_HEADER_SECTIONS = {
+    'critical': 'critical',
+    'major': 'major',
+    'code quality': 'quality',
+    'quality': 'quality',
+    'performance': 'performance',
+    'security': 'security',
+    'recommendation': 'recommendations',
+    'recommendations': 'recommendations',
+    'overall': 'overall',
+}
+
+# Maps a response line to its critique section in one case-insensitive
+# C-level scan; group names double as the section keys
+SECTION_RE = re.compile(
+    r"(?P<critical>critical|severe|urgent|vulnerability)"
+    r"|(?P<major>major|significant|important)"
+    r"|(?P<quality>quality|maintainability|readability|solid)"
+    r"|(?P<performance>performance|speed|efficiency|optimization)"
+    r"|(?P<security>security|injection|authentication)"
+    r"|(?P<recommendations>recommend|suggest|should|could)",
+    re.IGNORECASE
+)
+
+# Tokens that suggest the input is code rather than an architecture plan,
+# compiled into one alternation so the input is scanned in a single pass
+_CODE_INDICATORS = [
+    'def ', 'class ', 'function ', 'import ', 'from ',
+    '{', '}', '()', '=>', 'return ', 'if ', 'for ',
+    'const ', 'let ', 'var ', '<?php', 'public ', 'private '
+]
+CODE_INDICATOR_RE = re.compile(
+    '|'.join(re.escape(indicator) for indicator in _CODE_INDICATORS)
+)
+
 
 class BaseArchitect(ABC):
     """Base class for nitpicky systems architects"""
-    
+
+    # Exact-match critique cache shared across instances: identical
+    # (model, system prompt, user prompt) triples skip the LLM round-trip.
+    # LRU-evicted once it exceeds _RESPONSE_CACHE_MAX entries.
+    _response_cache: "OrderedDict[str, str]" = OrderedDict()
+    _RESPONSE_CACHE_MAX = 512
+
+    # Semantic cache for near-duplicate prompts: (normalized embedding,
+    # critique) pairs. Only active for providers that implement _embed.
+    _semantic_cache: list = []
+    _SEMANTIC_CACHE_MAX = 256
+    _SEMANTIC_THRESHOLD = float(os.environ.get('STATLER_SEMANTIC_CACHE_THRESHOLD', '0.92'))
+
+    # Circuit breaker: after this many consecutive connection failures,
+    # short-circuit reviews for the cooldown instead of paying the full
+    # connect/read timeout on every call
+    _CB_FAILURE_THRESHOLD = 3
+    _CB_COOLDOWN = 30.0
+
     def __init__(self, config):
         self.config = config
-        self.client = AsyncClient(timeout=config.timeout)
-    
+        # Shared pooled client: connections stay warm across architects
+        self.client = get_client(config.timeout)
+        self._cb_fail_count = 0
+        self._cb_open_until = 0.0
+        self._last_error_response: Optional[str] = None
+
     async def __aenter__(self):
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        # The client is shared process-wide; it is closed at exit by
+        # tools.http_clients, not per architect
+        pass
     
-    async def review(self, code_or_plan: str, context: str = "") -> str:
+    async def review(self, code_or_plan: str, context: str = "",
+                     kind: Optional[str] = None) -> str:
         """
         Review code or architectural plans with a critical eye
-        
+
         Args:
             code_or_plan: The code snippet or architectural plan to review
             context: Additional context about the code/plan
-            
+            kind: "code" or "architecture" when the caller already knows;
+                None falls back to the content heuristic
+
         Returns:
             Structured critique from the architect
         """
         try:
-            # Perform any provider-specific checks
-            check_result = await self._pre_review_check()
-            if check_result:
-                return check_result
-            
-            # Determine if this is code or architecture review
-            is_code = self._looks_like_code(code_or_plan)
-            
+            # Determine if this is code or architecture review; an explicit
+            # kind skips the text scan (and its prose false-positives)
+            if kind is None:
+                kind = "code" if self._looks_like_code(code_or_plan) else "architecture"
+
             # Prepare the prompt
-            if is_code:
+            if kind == "code":
                 user_prompt = CODE_REVIEW_PROMPT_TEMPLATE.format(
                     code=code_or_plan,
                     context=context or "No additional context provided"
@@ -58,26 +133,60 @@ class BaseArchitect(ABC):
                     plan=code_or_plan,
                     context=context or "No additional context provided"
                 )
-            
+
+            # Exact-match cache: a repeated prompt skips the provider checks
+            # and the multi-second LLM round-trip entirely
+            cache_key = self._cache_key(user_prompt)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.debug("Response cache hit for prompt %s", cache_key[:12])
+                return cached
+
+            # Circuit breaker: while open, return the last connection error
+            # immediately instead of timing out again
+            if time.monotonic() < self._cb_open_until and self._last_error_response:
+                logger.debug("Circuit breaker open; skipping %s call", self.config.provider)
+                return self._last_error_response
+
+            # Semantic cache: a near-duplicate of an earlier prompt reuses
+            # its critique without a generation call
+            embedding = await self._embed(user_prompt)
+            if embedding is not None:
+                cached = self._semantic_lookup(embedding)
+                if cached is not None:
+                    logger.debug("Semantic cache hit for prompt %s", cache_key[:12])
+                    return cached
+
+            # Perform any provider-specific checks
+            check_result = await self._pre_review_check()
+            if check_result:
+                return check_result
+
             # Call the LLM provider
             response = await self._call_llm(user_prompt)
-            
+            self._cb_fail_count = 0
+
             # Parse and format the response
             critique = self._parse_llm_response(response)
-            return format_critique(critique)
-            
+            formatted = format_critique(critique)
+            self._store_response(cache_key, formatted)
+            if embedding is not None:
+                self._store_semantic(embedding, formatted)
+            return formatted
+
         except ReadTimeout as e:
             logger.error(f"Timeout waiting for response after {self.config.timeout}s: {e}")
-            return self._format_error_response(
+            return self._record_connection_failure(self._format_error_response(
                 f"Request timed out after {self.config.timeout} seconds",
                 self._get_timeout_recommendations()
-            )
+            ))
         except ConnectError as e:
             logger.error(f"Failed to connect to {self.config.api_base_url}: {e}")
-            return self._format_error_response(
+            return self._record_connection_failure(self._format_error_response(
                 f"Cannot connect to {self.config.provider} at {self.config.api_base_url}",
                 self._get_connection_recommendations()
-            )
+            ))
         except HTTPStatusError as e:
             logger.error(f"HTTP error from {self.config.provider}: {e}")
             logger.error(f"Response body: {e.response.text}")
@@ -91,6 +200,132 @@ class BaseArchitect(ABC):
                 "3. Try restarting the MCP server"
             )
     
+    async def review_many(self, items: Iterable[Tuple[str, str]],
+                          max_concurrency: int = 8) -> List[str]:
+        """
+        Review several inputs concurrently
+
+        Each review is network/LLM-bound, so dispatching them together
+        collapses N serial round-trips into roughly one (bounded by the
+        provider's own parallelism, e.g. Ollama's OLLAMA_NUM_PARALLEL).
+
+        Args:
+            items: (code_or_plan, context) pairs to review
+            max_concurrency: Maximum number of in-flight reviews
+
+        Returns:
+            Critiques in the same order as the inputs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_review(code_or_plan: str, context: str) -> str:
+            async with semaphore:
+                return await self.review(code_or_plan, context)
+
+        return list(await asyncio.gather(
+            *(bounded_review(*item) for item in items)
+        ))
+
+    async def review_stream(self, items: Iterable[Tuple[str, str]],
+                            concurrency: int = 32):
+        """
+        Review a large batch with a sliding window, yielding as results land
+
+        Unlike review_many, this never materializes the whole batch: at
+        most `concurrency` reviews are in flight, and the next item is
+        only submitted when one completes. That keeps memory flat for
+        arbitrarily long iterators (e.g. a whole repo file-by-file) while
+        holding the provider at steady saturation.
+
+        Args:
+            items: (code_or_plan, context) pairs; may be a lazy iterator
+            concurrency: Number of reviews kept in flight
+
+        Yields:
+            Critiques as they complete (not necessarily in input order)
+        """
+        it = iter(items)
+        pending = set()
+
+        def submit() -> None:
+            item = next(it, None)
+            if item is not None:
+                pending.add(asyncio.ensure_future(self.review(*item)))
+
+        for _ in range(concurrency):
+            submit()
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+                submit()
+
+    def _cache_key(self, user_prompt: str) -> str:
+        """Content-addressed key over everything that affects the critique"""
+        h = hashlib.sha256()
+        h.update(self.config.model.encode())
+        h.update(b"\x00")
+        h.update(STATLER_SYSTEM_PROMPT.encode())
+        h.update(b"\x00")
+        h.update(user_prompt.encode())
+        return h.hexdigest()
+
+    def _store_response(self, cache_key: str, critique: str) -> None:
+        """Insert a critique into the shared cache, evicting the oldest entry"""
+        cache = self._response_cache
+        cache[cache_key] = critique
+        cache.move_to_end(cache_key)
+        if len(cache) > self._RESPONSE_CACHE_MAX:
+            cache.popitem(last=False)
+
+    async def _embed(self, text: str) -> Optional[list]:
+        """Embed text for the semantic cache.
+
+        Providers with an embeddings endpoint override this to return a
+        normalized vector; the default disables semantic caching. Must
+        return None (never raise) when embeddings are unavailable.
+        """
+        return None
+
+    def _semantic_lookup(self, embedding: list) -> Optional[str]:
+        """Return the cached critique most similar to the query embedding,
+        if its cosine similarity clears the threshold"""
+        best = None
+        best_sim = self._SEMANTIC_THRESHOLD
+        for vector, critique in self._semantic_cache:
+            if len(vector) != len(embedding):
+                continue
+            # Vectors are normalized at embed time, so the dot product is
+            # the cosine similarity
+            sim = sum(a * b for a, b in zip(vector, embedding))
+            if sim >= best_sim:
+                best_sim = sim
+                best = critique
+        return best
+
+    def _store_semantic(self, embedding: list, critique: str) -> None:
+        """Remember a critique under its prompt embedding"""
+        cache = self._semantic_cache
+        cache.append((embedding, critique))
+        if len(cache) > self._SEMANTIC_CACHE_MAX:
+            del cache[0]
+
+    def _record_connection_failure(self, error_response: str) -> str:
+        """Count a connection failure, opening the circuit breaker after
+        _CB_FAILURE_THRESHOLD consecutive ones"""
+        self._cb_fail_count += 1
+        self._last_error_response = error_response
+        if self._cb_fail_count >= self._CB_FAILURE_THRESHOLD:
+            self._cb_open_until = time.monotonic() + self._CB_COOLDOWN
+            logger.warning(
+                "%d consecutive connection failures; pausing %s calls for %ss",
+                self._cb_fail_count, self.config.provider, self._CB_COOLDOWN
+            )
+        return error_response
+
     @abstractmethod
     async def _pre_review_check(self) -> Optional[str]:
         """Perform any provider-specific pre-review checks. Return error message if check fails."""
@@ -124,14 +359,13 @@ class BaseArchitect(ABC):
     
     def _looks_like_code(self, text: str) -> bool:
         """Simple heuristic to determine if input is code or architecture description"""
-        code_indicators = [
-            'def ', 'class ', 'function ', 'import ', 'from ',
-            '{', '}', '()', '=>', 'return ', 'if ', 'for ',
-            'const ', 'let ', 'var ', '<?php', 'public ', 'private '
-        ]
-        
-        code_count = sum(1 for indicator in code_indicators if indicator in text)
-        return code_count >= 2
+        # Count distinct indicators in one pass, bailing out at two
+        seen = set()
+        for match in CODE_INDICATOR_RE.finditer(text):
+            seen.add(match.group())
+            if len(seen) >= 2:
+                return True
+        return False
     
     def _parse_llm_response(self, response: Dict[str, Any]) -> Dict[str, str]:
         """Parse LLM response into structured critique sections"""
@@ -139,59 +373,25 @@ class BaseArchitect(ABC):
             # Extract content from response - handle different formats
             content = self._extract_content_from_response(response)
             
-            # Initialize sections
+            # Fast path: the response follows the template's markdown
+            # headers, so one split assigns every section exactly. Fall
+            # back to the per-line keyword scan for free-form output
+            buckets = self._split_headed_sections(content)
+            if buckets is None:
+                buckets = self._scan_keyword_sections(content)
+
+            # Join the accumulated lines into the final section strings
             sections = {
-                'critical': [],
-                'major': [],
-                'quality': [],
-                'performance': [],
-                'security': [],
-                'recommendations': [],
-                'overall': ''
+                key: '\n'.join(f"• {item}" for item in value) if value else None
+                for key, value in buckets.items()
             }
-            
-            # Simple parsing based on keywords and sections
-            lines = content.split('\n')
-            current_section = None
-            
-            section_keywords = {
-                'critical': ['critical', 'severe', 'urgent', 'vulnerability'],
-                'major': ['major', 'significant', 'important'],
-                'quality': ['quality', 'maintainability', 'readability', 'solid'],
-                'performance': ['performance', 'speed', 'efficiency', 'optimization'],
-                'security': ['security', 'vulnerability', 'injection', 'authentication'],
-                'recommendations': ['recommend', 'suggest', 'should', 'could']
-            }
-            
-            for line in lines:
-                line_lower = line.lower()
-                
-                # Detect section changes
-                for section, keywords in section_keywords.items():
-                    if any(kw in line_lower for kw in keywords):
-                        current_section = section
-                        break
-                
-                # Add content to current section
-                if current_section and line.strip():
-                    if isinstance(sections[current_section], list):
-                        sections[current_section].append(line.strip())
-                    else:
-                        sections[current_section] += line.strip() + ' '
-            
-            # Format lists into strings
-            for key, value in sections.items():
-                if isinstance(value, list):
-                    if value:
-                        sections[key] = '\n'.join(f"• {item}" for item in value)
-                    else:
-                        sections[key] = None
-            
+            sections['overall'] = ' '.join(buckets['overall'])
+
             # Set overall assessment
             if not sections['overall']:
                 severity = "high" if sections['critical'] else "medium" if sections['major'] else "low"
                 sections['overall'] = f"Code review complete. Severity level: {severity}. See detailed feedback above."
-            
+
             return sections
             
         except Exception as e:
@@ -206,6 +406,52 @@ class BaseArchitect(ABC):
                 'overall': 'Review failed due to parsing error'
             }
     
+    @staticmethod
+    def _split_headed_sections(content: str) -> Optional[Dict[str, list]]:
+        """Bucket response lines by the template's markdown headers.
+
+        Returns None when the response doesn't use the headers, so the
+        caller can fall back to keyword scanning.
+        """
+        parts = HEADER_RE.split(content)
+        if len(parts) < 3:
+            return None
+
+        buckets = {key: [] for key in
+                   ('critical', 'major', 'quality', 'performance',
+                    'security', 'recommendations', 'overall')}
+        # split yields [preamble, header1, body1, header2, body2, ...]
+        for i in range(1, len(parts) - 1, 2):
+            bucket = buckets[_HEADER_SECTIONS[parts[i].lower()]]
+            for line in parts[i + 1].split('\n'):
+                stripped = line.strip()
+                if stripped:
+                    bucket.append(stripped)
+        return buckets
+
+    @staticmethod
+    def _scan_keyword_sections(content: str) -> Dict[str, list]:
+        """Bucket response lines by section keywords, one regex per line"""
+        # Accumulate every section as a list of lines; joining once at
+        # the end keeps the build O(n) instead of repeated str +=
+        buckets = {key: [] for key in
+                   ('critical', 'major', 'quality', 'performance',
+                    'security', 'recommendations', 'overall')}
+        current_section = None
+
+        for line in content.split('\n'):
+            # Detect section changes
+            match = SECTION_RE.search(line)
+            if match:
+                current_section = match.lastgroup
+
+            # Add content to current section
+            stripped = line.strip()
+            if current_section and stripped:
+                buckets[current_section].append(stripped)
+
+        return buckets
+
     @abstractmethod
     def _extract_content_from_response(self, response: Dict[str, Any]) -> str:
         """Extract the text content from provider-specific response format"""
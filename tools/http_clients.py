@@ -0,0 +1,67 @@
+"""Shared httpx client pool for the architect tools"""
+import asyncio
+import atexit
+import importlib.util
+import logging
+from typing import Dict
+
+import httpx
+from httpx import AsyncClient
+
+logger = logging.getLogger(__name__)
+
+# Generous keep-alive pool so repeated LLM calls reuse warm connections
+# instead of paying TCP/TLS setup per request; keepalive_expiry keeps
+# connections warm across the gaps between reviews
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=60
+)
+
+# HTTP/2 lets concurrent reviews multiplex over one TLS connection to
+# OpenRouter; enabled when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_clients: Dict[float, AsyncClient] = {}
+
+
+def get_client(timeout: float) -> AsyncClient:
+    """Get the process-wide AsyncClient for a timeout, creating it lazily.
+
+    Clients are cached per timeout and transparently replaced if a caller
+    closed the previous one, so architects share keep-alive connections
+    across instances (tests create and close architects repeatedly).
+    The connect timeout is capped at 5s so a dead host fails fast instead
+    of consuming the full read timeout.
+    """
+    client = _clients.get(timeout)
+    if client is None or client.is_closed:
+        client = AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=_LIMITS,
+            http2=_HTTP2
+        )
+        _clients[timeout] = client
+    return client
+
+
+async def _aclose_clients(clients) -> None:
+    for client in clients:
+        await client.aclose()
+
+
+def _close_all() -> None:
+    """Best-effort close of any clients still open at interpreter exit"""
+    open_clients = [c for c in _clients.values() if not c.is_closed]
+    _clients.clear()
+    if not open_clients:
+        return
+    try:
+        asyncio.run(_aclose_clients(open_clients))
+    except Exception:
+        # Sockets are reclaimed by the OS on exit anyway
+        pass
+
+
+atexit.register(_close_all)
@@ -1,31 +1,58 @@
 """Statler architect tool implementation with Ollama integration"""
-import json
 import logging
+import math
+import time
 from typing import Dict, Any, Optional
 import httpx
+import orjson
 from httpx import AsyncClient, HTTPStatusError, ConnectError, ReadTimeout
 
-from statler_config import config
+from statler_config import get_config
 from tools.base_architect import BaseArchitect
 from prompts.statler_prompts import STATLER_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Built once so every request shares byte-identical system-message bytes,
+# which keeps the serialized prefix stable for provider KV-cache reuse
+_SYSTEM_MSG = {"role": "system", "content": STATLER_SYSTEM_PROMPT}
+
 
 class StatlerArchitect(BaseArchitect):
     """The nitpicky systems architect powered by Ollama"""
-    
+
+    # How long a successful availability check stays valid
+    _MODEL_CHECK_TTL = 60.0
+
     def __init__(self):
-        super().__init__(config)
-    
+        super().__init__(get_config())
+        self._model_ok_until = 0.0
+        # Constant part of every chat payload. Deterministic decoding
+        # (temperature 0, top_p 1.0) makes the critique caches effective
+        # and keeps the system prompt eligible for prefix KV-cache reuse;
+        # Ollama only honors sampling parameters inside "options"
+        self._base_payload = {
+            "model": self.config.ollama_model,
+            "stream": True,
+            "options": {"temperature": 0, "top_p": 1.0}
+        }
+
     async def check_model_availability(self) -> bool:
-        """Check if the configured model is available in Ollama"""
+        """Check if the configured model is available in Ollama.
+
+        A successful check is cached for _MODEL_CHECK_TTL seconds so
+        back-to-back reviews don't re-fetch /api/tags; failures are never
+        cached.
+        """
+        if time.monotonic() < self._model_ok_until:
+            return True
+
         try:
             url = f"{self.config.ollama_api_base}/api/tags"
             response = await self.client.get(url, timeout=10.0)
             response.raise_for_status()
-            
-            data = response.json()
+
+            data = orjson.loads(response.content)
             models = data.get('models', [])
             model_names = [model.get('name', '') for model in models]
             
@@ -33,6 +60,7 @@ class StatlerArchitect(BaseArchitect):
             for model_name in model_names:
                 if model_name == self.config.ollama_model or model_name.startswith(f"{self.config.ollama_model}:"):
                     logger.info(f"Model '{self.config.ollama_model}' is available")
+                    self._model_ok_until = time.monotonic() + self._MODEL_CHECK_TTL
                     return True
             
             logger.warning(f"Model '{self.config.ollama_model}' not found. Available models: {model_names}")
@@ -42,6 +70,32 @@ class StatlerArchitect(BaseArchitect):
             logger.error(f"Failed to check model availability: {e}")
             return False
     
+    async def _embed(self, text: str) -> Optional[list]:
+        """Embed text via Ollama's embeddings endpoint for the semantic cache"""
+        try:
+            url = f"{self.config.ollama_api_base}/api/embeddings"
+            response = await self.client.post(
+                url,
+                content=orjson.dumps({"model": self.config.ollama_model, "prompt": text}),
+                headers={"Content-Type": "application/json"},
+                timeout=10.0
+            )
+            response.raise_for_status()
+
+            embedding = orjson.loads(response.content).get('embedding')
+            if not embedding:
+                return None
+
+            # Normalize so cache lookups reduce to a dot product
+            norm = math.sqrt(sum(x * x for x in embedding))
+            if norm == 0:
+                return None
+            return [x / norm for x in embedding]
+
+        except Exception as e:
+            logger.debug("Embedding unavailable for semantic cache: %s", e)
+            return None
+
     async def _pre_review_check(self) -> Optional[str]:
         """Perform Ollama-specific pre-review checks"""
         if not await self.check_model_availability():
@@ -55,26 +109,44 @@ class StatlerArchitect(BaseArchitect):
         return None
     
     async def _call_llm(self, prompt: str) -> Dict[str, Any]:
-        """Make API call to Ollama"""
+        """Make a streaming API call to Ollama"""
         url = self.config.get_ollama_chat_url()
-        
+
         payload = {
-            "model": self.config.ollama_model,
-            "messages": [
-                {"role": "system", "content": STATLER_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            "stream": False,
-            "temperature": 0.7,
-            "top_p": 0.9
+            **self._base_payload,
+            "messages": [_SYSTEM_MSG, {"role": "user", "content": prompt}]
         }
-        
+
         logger.debug(f"Calling Ollama at {url} with model {self.config.ollama_model}")
-        
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        
-        return response.json()
+
+        # Stream chunks as they are generated so transport overlaps
+        # generation instead of waiting for the full JSON body
+        # orjson serializes/parses the multi-KB payloads several times
+        # faster than stdlib json, straight to bytes
+        parts = []
+        async with self.client.stream(
+            "POST", url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status_code >= 400:
+                # Read the body so error handlers can inspect it
+                await response.aread()
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                message = chunk.get('message')
+                if message and message.get('content'):
+                    parts.append(message['content'])
+                if chunk.get('done'):
+                    break
+
+        # Preserve the non-streaming response shape for
+        # _extract_content_from_response
+        return {"message": {"content": ''.join(parts)}}
     
     def _extract_content_from_response(self, response: Dict[str, Any]) -> str:
         """Extract the text content from Ollama response format"""
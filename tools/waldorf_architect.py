@@ -1,6 +1,7 @@
 """Waldorf architect tool implementation with OpenRouter integration"""
-import json
 import logging
+
+import orjson
 from typing import Dict, Any, Optional
 from httpx import HTTPStatusError, ConnectError, ReadTimeout
 
@@ -10,12 +11,28 @@ from prompts.statler_prompts import STATLER_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Built once so every request shares byte-identical system-message bytes,
+# which keeps the serialized prefix stable for provider KV-cache reuse
+_SYSTEM_MSG = {"role": "system", "content": STATLER_SYSTEM_PROMPT}
+
 
 class WaldorfArchitect(BaseArchitect):
     """The nitpicky systems architect powered by OpenRouter"""
     
     def __init__(self):
         super().__init__(waldorf_config)
+        # Constant part of every chat payload. Deterministic decoding
+        # (temperature 0, top_p 1.0) makes the critique caches effective
+        # and keeps the system prompt eligible for prefix KV-cache reuse
+        self._base_payload = {
+            "model": self.config.openrouter_model,
+            "stream": True,
+            "temperature": 0,
+            "top_p": 1.0
+        }
+        # Reused as the prefix of every messages list, so only the user
+        # dict is allocated per call
+        self._system_messages = [_SYSTEM_MSG]
     
     async def _pre_review_check(self) -> Optional[str]:
         """OpenRouter doesn't require pre-review model checks"""
@@ -24,27 +41,53 @@ class WaldorfArchitect(BaseArchitect):
         return None
     
     async def _call_llm(self, prompt: str) -> Dict[str, Any]:
-        """Make API call to OpenRouter"""
+        """Make a streaming API call to OpenRouter"""
         url = self.config.get_openrouter_chat_url()
         headers = self.config.get_headers()
-        
+
         payload = {
-            "model": self.config.openrouter_model,
-            "messages": [
-                {"role": "system", "content": STATLER_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            "stream": False,
-            "temperature": 0.7,
-            "top_p": 0.9
+            **self._base_payload,
+            "messages": self._system_messages + [{"role": "user", "content": prompt}]
         }
-        
+
         logger.debug(f"Calling OpenRouter at {url} with model {self.config.openrouter_model}")
-        
-        response = await self.client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        
-        return response.json()
+
+        # Consume the SSE stream incrementally so transport overlaps
+        # generation instead of waiting for the full response
+        # orjson serializes/parses the multi-KB payloads several times
+        # faster than stdlib json, straight to bytes
+        parts = []
+        async with self.client.stream(
+            "POST", url,
+            content=orjson.dumps(payload),
+            headers={**headers, "Content-Type": "application/json"}
+        ) as response:
+            if response.status_code >= 400:
+                # Read the body so error handlers can inspect it
+                await response.aread()
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                # OpenRouter sends OpenAI-style SSE frames plus keep-alive
+                # comments; only data frames carry content
+                if not line.startswith('data: '):
+                    continue
+                data = line[6:]
+                if data == '[DONE]':
+                    break
+                try:
+                    chunk = orjson.loads(data)
+                except ValueError:
+                    continue
+                choices = chunk.get('choices') or []
+                if choices:
+                    content = (choices[0].get('delta') or {}).get('content')
+                    if content:
+                        parts.append(content)
+
+        # Preserve the non-streaming response shape for
+        # _extract_content_from_response
+        return {"choices": [{"message": {"content": ''.join(parts)}}]}
     
     def _extract_content_from_response(self, response: Dict[str, Any]) -> str:
         """Extract the text content from OpenRouter response format"""
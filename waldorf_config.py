@@ -2,33 +2,40 @@
 import os
 import sys
 import logging
+from dataclasses import dataclass
 from shared_config import BaseConfig
 
 logger = logging.getLogger(__name__)
 
 
+# repr=False keeps BaseConfig's compact __repr__ (and the API key out of logs)
+@dataclass(frozen=True, slots=True, repr=False)
 class WaldorfConfig(BaseConfig):
     """Configuration handler for Waldorf MCP (OpenRouter)"""
-    
-    def __init__(self):
-        super().__init__(
+
+    openrouter_api_key: str
+
+    @classmethod
+    def from_env(cls) -> "WaldorfConfig":
+        """Build the config from environment variables"""
+        fields = cls._resolve_base(
             provider="OpenRouter",
             env_prefix="OPENROUTER",
             default_base_url="https://openrouter.ai/api/v1",
             default_model="openai/gpt-3.5-turbo",
             default_timeout=60.0
         )
-        
+
         # OpenRouter-specific: API key
-        self.openrouter_api_key = self._get_openrouter_api_key()
-        self._validate_api_key()
-        
-        # Keep compatibility with existing code
-        self.openrouter_base_url = self.api_base_url
-        self.openrouter_model = self.model
-        self.openrouter_timeout = self.timeout
-    
-    def _get_openrouter_api_key(self) -> str:
+        api_key = cls._get_openrouter_api_key()
+        if not api_key:
+            logger.error("OPENROUTER_API_KEY is required for OpenRouter API access")
+            sys.exit(1)
+
+        return cls(**fields, openrouter_api_key=api_key)
+
+    @staticmethod
+    def _get_openrouter_api_key() -> str:
         """Get OpenRouter API key from environment"""
         api_key = os.environ.get('OPENROUTER_API_KEY', '')
         if api_key:
@@ -36,17 +43,24 @@ class WaldorfConfig(BaseConfig):
         else:
             logger.error("OPENROUTER_API_KEY environment variable not set")
         return api_key
-    
-    def _validate_api_key(self) -> None:
-        """Validate API key is present"""
-        if not self.openrouter_api_key:
-            logger.error("OPENROUTER_API_KEY is required for OpenRouter API access")
-            sys.exit(1)
-    
+
+    # Keep compatibility with existing code
+    @property
+    def openrouter_base_url(self) -> str:
+        return self.api_base_url
+
+    @property
+    def openrouter_model(self) -> str:
+        return self.model
+
+    @property
+    def openrouter_timeout(self) -> float:
+        return self.timeout
+
     def get_openrouter_chat_url(self) -> str:
         """Get the full URL for OpenRouter chat completions endpoint"""
         return f"{self.openrouter_base_url}/chat/completions"
-    
+
     def get_headers(self) -> dict:
         """Get headers for OpenRouter API requests"""
         return {
@@ -59,7 +73,7 @@ class WaldorfConfig(BaseConfig):
 
 # Global config instance
 try:
-    waldorf_config = WaldorfConfig()
+    waldorf_config = WaldorfConfig.from_env()
 except Exception as e:
     logger.error(f"Failed to initialize Waldorf configuration: {e}")
-    sys.exit(1)
\ No newline at end of file
+    sys.exit(1)